@@ -1,35 +1,45 @@
-import hashlib
-import zlib
-
-
 class SimpleBloomFilter:
     """
     A probabilistic data structure for fast existence checks.
-    Uses three independent hash functions to minimize false positives.
+    Derives k hash functions from a single 64-bit hash using
+    Kirsch-Mitzenmacher double hashing: g_i(x) = h1(x) + i * h2(x).
+    Bits are packed eight per byte in a bytearray.
     """
-    
-    def __init__(self, size=10000):
+
+    def __init__(self, size=10000, num_hashes=3):
         self.size = size
-        self.bit_array = [0] * size
+        self.num_hashes = num_hashes
+        self.bit_array = bytearray((size + 7) >> 3)
 
     def _hashes(self, value):
         """
-        Generate three independent hash values for the same input.
-        
-        Returns:
-            List of three hash indices
+        Generate k hash indices for the same input.
+
+        The built-in str hash is computed once (and cached on the string),
+        then split into two 32-bit halves h1 and h2. Each 32-bit probe is
+        mapped onto [0, size) with fastrange (multiply + shift) instead of
+        a modulo.
+
+        Yields:
+            num_hashes hash indices
         """
-        return [
-            hash(value) % self.size,
-            zlib.crc32(value.encode()) % self.size,
-            int(hashlib.md5(value.encode()).hexdigest(), 16) % self.size
-        ]
+        h = hash(value)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) & 0xFFFFFFFF
+        size = self.size
+        for i in range(self.num_hashes):
+            yield (((h1 + i * h2) & 0xFFFFFFFF) * size) >> 32
 
     def add(self, value):
-        """Add a value to the Bloom filter by setting three bit positions."""
+        """Add a value to the Bloom filter by setting k bit positions."""
+        bits = self.bit_array
         for h in self._hashes(value):
-            self.bit_array[h] = 1
+            bits[h >> 3] |= 1 << (h & 7)
 
     def contains(self, value):
-        """Check if a value might exist in the Bloom filter."""
-        return all(self.bit_array[h] == 1 for h in self._hashes(value))
+        """Check if a value might exist, stopping at the first unset bit."""
+        bits = self.bit_array
+        for h in self._hashes(value):
+            if not bits[h >> 3] & (1 << (h & 7)):
+                return False
+        return True
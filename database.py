@@ -1,25 +1,230 @@
-from bloom_filter import SimpleBloomFilter
+import os
+import sys
+import threading
+from array import array
+
+from fast_bloom import BlockedBloomFilter
+
+
+BLOOM_BITS_PER_ENTRY = 16
 
 
 class InMemoryDB:
     """
     In-memory database for storing short URL to long URL mappings.
-    Uses a Bloom filter for fast existence checks.
+    Uses a cache-line-blocked Bloom filter for fast existence checks; the
+    filter doubles whenever the mappings outgrow BLOOM_BITS_PER_ENTRY bits
+    each, so its false positive rate stays bounded however many are saved.
+    Saves and rebuilds hold a lock, so every saved key is in the filter
+    that replaces the old one.
     """
     
-    def __init__(self):
+    def __init__(self, expected_size=None):
+        """
+        Initialize the database.
+        
+        Args:
+            expected_size: Approximate number of mappings to be stored; sizes
+                the Bloom filter so it does not saturate under bulk inserts
+        """
         self.map = {}  # short → long
-        self.bloom = SimpleBloomFilter()
+        self._lock = threading.Lock()  # serializes saves with Bloom rebuilds
+        if expected_size is None:
+            self.bloom = BlockedBloomFilter()
+        else:
+            self.bloom = BlockedBloomFilter(size=expected_size * BLOOM_BITS_PER_ENTRY)
 
     def exists(self, short_url):
-        """Check if a short URL exists using Bloom filter."""
+        """
+        Check if a short URL might exist using the Bloom filter.
+        Meant for the pre-insert collision check; reads use get() directly.
+        """
         return self.bloom.contains(short_url)
 
+    def __contains__(self, short_url):
+        """Exact membership test (a single dict lookup, no Bloom probe)."""
+        return short_url in self.map
+
+    def save(self, short_url, long_url):
+        """Save a short URL to long URL mapping (short URL keys are interned)."""
+        with self._lock:
+            self.map[sys.intern(short_url)] = long_url
+            self.bloom.add(short_url)
+            if len(self.map) * BLOOM_BITS_PER_ENTRY > self.bloom.size:
+                self._grow_bloom(2 * len(self.map))
+
+    def get(self, short_url):
+        """Retrieve the long URL for a given short URL (no Bloom probe)."""
+        return self.map.get(short_url)
+
+    def _keys(self):
+        """Iterate over all stored short URLs."""
+        return iter(self.map)
+
+    def reserve(self, expected_size):
+        """
+        Prepare for about expected_size mappings before a bulk load.
+        
+        Grows the Bloom filter (re-adding existing keys) so it does not
+        saturate; never shrinks. CPython offers no way to pre-size a dict.
+        """
+        with self._lock:
+            self._grow_bloom(expected_size)
+
+    def _grow_bloom(self, expected_size):
+        """Rebuild the Bloom filter for expected_size mappings; caller holds the lock."""
+        size = expected_size * BLOOM_BITS_PER_ENTRY
+        if size > self.bloom.size:
+            bloom = BlockedBloomFilter(size=size)
+            for short_url in self._keys():
+                bloom.add(short_url)
+            self.bloom = bloom
+
+
+class PackedDB(InMemoryDB):
+    """
+    Memory-compact variant of InMemoryDB for large numbers of mappings.
+    Instead of a dict of str objects, each mapping is appended to a single
+    bytearray arena as UTF-8 (short bytes then long bytes), and short URLs
+    are found through an open-addressing (linear probing) index of entry
+    numbers held in flat arrays. Saves hold the store's lock and publish an
+    entry in the index only after its bytes are written.
+    """
+    
+    def __init__(self, expected_size=None):
+        super().__init__(expected_size)
+        self.map = None  # replaced by the packed arrays below
+        self.count = 0
+        capacity = 8
+        while capacity < 2 * (expected_size or 0):
+            capacity <<= 1
+        self.table = array("q", [-1]) * capacity  # slot → entry, -1 if empty
+        self.hashes = array("q")  # entry → hash(short_url)
+        self.key_lengths = array("I")  # entry → byte length of short_url
+        self.offsets = array("Q", [0])  # entry i spans offsets[i]:offsets[i + 1]
+        self.arena = bytearray()
+
+    def _probe(self, key, h):
+        """Return (slot, entry) for a short URL; entry is -1 if absent."""
+        table = self.table
+        mask = len(table) - 1
+        slot = h & mask
+        while True:
+            entry = table[slot]
+            if entry < 0:
+                return slot, entry
+            if self.hashes[entry] == h:
+                start = self.offsets[entry]
+                if self.arena[start:start + self.key_lengths[entry]] == key:
+                    return slot, entry
+            slot = (slot + 1) & mask
+
+    def _grow(self):
+        """Double the index, keeping the load factor at most 1/2."""
+        table = array("q", [-1]) * (2 * len(self.table))
+        mask = len(table) - 1
+        for entry in self.table:
+            if entry >= 0:
+                slot = self.hashes[entry] & mask
+                while table[slot] >= 0:
+                    slot = (slot + 1) & mask
+                table[slot] = entry
+        self.table = table
+
     def save(self, short_url, long_url):
-        """Save a short URL to long URL mapping."""
-        self.map[short_url] = long_url
-        self.bloom.add(short_url)
+        """Save a mapping; overwriting a short URL leaves its old bytes unused."""
+        key = short_url.encode()
+        value = long_url.encode()  # encode first so a bad URL changes nothing
+        h = hash(short_url)
+        with self._lock:
+            if 2 * (self.count + 1) > len(self.table):
+                self._grow()
+            slot, entry = self._probe(key, h)
+            self.hashes.append(h)
+            self.key_lengths.append(len(key))
+            self.arena += key
+            self.arena += value
+            self.offsets.append(len(self.arena))
+            self.table[slot] = len(self.hashes) - 1  # publish once the entry is complete
+            if entry < 0:
+                self.count += 1
+            self.bloom.add(short_url)
+            if self.count * BLOOM_BITS_PER_ENTRY > self.bloom.size:
+                self._grow_bloom(2 * self.count)
+
+    def __contains__(self, short_url):
+        """Exact membership test through the packed index."""
+        return self._probe(short_url.encode(), hash(short_url))[1] >= 0
 
     def get(self, short_url):
         """Retrieve the long URL for a given short URL."""
-        return self.map.get(short_url, None)
+        slot, entry = self._probe(short_url.encode(), hash(short_url))
+        if entry < 0:
+            return None
+        start = self.offsets[entry] + self.key_lengths[entry]
+        return self.arena[start:self.offsets[entry + 1]].decode()
+
+    def _keys(self):
+        """Iterate over all stored short URLs."""
+        for entry in self.table:
+            if entry >= 0:
+                start = self.offsets[entry]
+                yield self.arena[start:start + self.key_lengths[entry]].decode()
+
+    def reserve(self, expected_size):
+        """
+        Prepare for about expected_size mappings before a bulk load.
+        
+        Also pre-sizes the index so saves never trigger a resize.
+        """
+        with self._lock:
+            self._grow_bloom(expected_size)
+            while 2 * expected_size > len(self.table):
+                self._grow()
+
+
+class ShardedDB:
+    """
+    Database split into power-of-two independent InMemoryDB shards.
+    Each short URL lives in shard hash(short_url) & (num_shards - 1), so
+    concurrent requests mostly touch different dicts and Bloom filters.
+    Same exists/save/get interface as InMemoryDB.
+    """
+    
+    def __init__(self, expected_size=None, num_shards=None):
+        """
+        Initialize the shards.
+        
+        Args:
+            expected_size: Approximate total number of mappings
+            num_shards: Shard count, rounded up to a power of two;
+                defaults to the CPU count
+        """
+        n = 1
+        while n < (num_shards or os.cpu_count() or 1):
+            n <<= 1
+        per_shard = None if expected_size is None else -(-expected_size // n)
+        self.shards = [InMemoryDB(per_shard) for _ in range(n)]
+        self.mask = n - 1
+
+    def exists(self, short_url):
+        """Check if a short URL might exist using its shard's Bloom filter."""
+        return self.shards[hash(short_url) & self.mask].exists(short_url)
+
+    def __contains__(self, short_url):
+        """Exact membership test in the owning shard."""
+        return short_url in self.shards[hash(short_url) & self.mask]
+
+    def save(self, short_url, long_url):
+        """Save a short URL to long URL mapping in its shard."""
+        self.shards[hash(short_url) & self.mask].save(short_url, long_url)
+
+    def get(self, short_url):
+        """Retrieve the long URL for a given short URL from its shard."""
+        return self.shards[hash(short_url) & self.mask].get(short_url)
+
+    def reserve(self, expected_size):
+        """Prepare every shard for its share of expected_size mappings."""
+        per_shard = -(-expected_size // len(self.shards))
+        for shard in self.shards:
+            shard.reserve(per_shard)
@@ -1,20 +1,48 @@
 BASE62 = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+# All 62 * 62 two-digit strings, so one divmod emits two digits at a time.
+BASE62_PAIRS = tuple(a + b for a in BASE62 for b in BASE62)
+
 
 def base62_encode(num):
     """
     Convert a number to base62 representation.
     
+    Emits two digits per divmod via BASE62_PAIRS.
+    
     Args:
         num: Non-negative integer to encode
         
     Returns:
         Base62 encoded string
     """
-    if num == 0:
-        return "0"
+    out = ""
+    while num >= 3844:
+        num, rem = divmod(num, 3844)
+        out = BASE62_PAIRS[rem] + out
+    return (BASE62_PAIRS[num] if num >= 62 else BASE62[num]) + out
+
+
+def base62_encode_batch(nums):
+    """
+    Convert many numbers to base62 in one call.
+    
+    Same algorithm as base62_encode, inlined with all lookups in locals
+    to avoid a function call and global loads per number.
+    
+    Args:
+        nums: Iterable of non-negative integers to encode
+        
+    Returns:
+        List of base62 encoded strings, in input order
+    """
+    digits = BASE62
+    pairs = BASE62_PAIRS
     result = []
-    while num > 0:
-        num, rem = divmod(num, 62)
-        result.append(BASE62[rem])
-    return ''.join(reversed(result))
+    for num in nums:
+        out = ""
+        while num >= 3844:
+            num, rem = divmod(num, 3844)
+            out = pairs[rem] + out
+        result.append((pairs[num] if num >= 62 else digits[num]) + out)
+    return result
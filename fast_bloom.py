@@ -0,0 +1,49 @@
+BLOCK_BITS = 512  # one 64-byte cache line
+LANE_BITS = 64
+
+# Odd multipliers used to derive one bit per 64-bit lane from a single
+# 32-bit hash (multiply-shift rehashing, as in Impala's AVX2 filter).
+SALTS = (
+    0x47b6137b, 0x44974d91, 0x8824ad5b, 0xa2b7289d,
+    0x705495c7, 0x2df1424b, 0x9efc4947, 0x5c6bfb31,
+)
+LANES = tuple((lane * LANE_BITS, salt) for lane, salt in enumerate(SALTS))
+
+
+class BlockedBloomFilter:
+    """
+    Cache-line-blocked Bloom filter (RocksDB FastLocalBloom style).
+    Every value maps to a single 512-bit block and sets one bit in each of
+    its eight 64-bit lanes, so a lookup touches one block and is decided by
+    a single AND against a precomputed mask.
+    """
+
+    def __init__(self, size=10000):
+        self.num_blocks = max(1, -(-size // BLOCK_BITS))
+        self.size = self.num_blocks * BLOCK_BITS
+        self.blocks = [0] * self.num_blocks
+
+    def _locate(self, value):
+        """
+        Map a value to its block and in-block bit mask.
+
+        Returns:
+            Tuple of (block index, 512-bit mask)
+        """
+        h = hash(value)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) & 0xFFFFFFFF
+        mask = 0
+        for offset, salt in LANES:
+            mask |= 1 << (offset + (((h2 * salt) & 0xFFFFFFFF) >> 26))
+        return (h1 * self.num_blocks) >> 32, mask
+
+    def add(self, value):
+        """Add a value by OR-ing its mask into its block."""
+        idx, mask = self._locate(value)
+        self.blocks[idx] |= mask
+
+    def contains(self, value):
+        """Check if a value might exist in the Bloom filter."""
+        idx, mask = self._locate(value)
+        return self.blocks[idx] & mask == mask
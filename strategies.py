@@ -1,9 +1,29 @@
 from abc import ABC, abstractmethod
 import hashlib
+import itertools
+import threading
+import weakref
 import zlib
 from database import InMemoryDB
-from encoding import base62_encode
-from snowflake import Snowflake
+from encoding import base62_encode, base62_encode_batch
+from snowflake import MAX_WORKERS, Snowflake
+
+try:
+    from crc32c import crc32c  # optional: SSE4.2/ARMv8 hardware CRC32C
+except ImportError:
+    crc32c = None
+
+
+SHORT_URL_LENGTH = 7
+_CODE_SPACE = 62 ** SHORT_URL_LENGTH
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15  # 2**64 / golden ratio, odd
+_HASH_CLASSES = {"md5": hashlib.md5, "sha1": hashlib.sha1}
+
+
+def _short_code(num):
+    """Encode an integer hash as a fixed-width base62 short code."""
+    return base62_encode(num % _CODE_SPACE).rjust(SHORT_URL_LENGTH, "0")
 
 
 class ShorteningStrategy(ABC):
@@ -31,6 +51,32 @@ class ShorteningStrategy(ABC):
         """
         pass
 
+    def shorten_and_store(self, long_url, db: InMemoryDB):
+        """
+        Shorten a long URL and store the mapping in one call.
+        
+        This is what URLShortener calls. get_shortened_url() already saves
+        the mapping, so the default simply delegates; URLShortener skips
+        this frame and binds get_shortened_url() when it is not overridden.
+        """
+        return self.get_shortened_url(long_url, db)
+
+    def get_shortened_urls(self, long_urls, db: InMemoryDB):
+        """
+        Shorten many long URLs in one call.
+        
+        Strategies that can amortize work across a batch override this.
+        
+        Args:
+            long_urls: Iterable of URLs to shorten
+            db: Database instance for storing mappings
+            
+        Returns:
+            List of shortened URL strings, in input order
+        """
+        shorten = self.shorten_and_store
+        return [shorten(long_url, db) for long_url in long_urls]
+
 
 class HashShortener(ShorteningStrategy):
     """
@@ -45,18 +91,23 @@ class HashShortener(ShorteningStrategy):
         Initialize hash shortener.
         
         Args:
-            method: Hash algorithm to use ('md5', 'sha1', 'crc32')
+            method: Hash algorithm to use ('md5', 'sha1', 'crc32', 'crc32c');
+                'crc32c' needs the optional crc32c package
         """
+        if method == "crc32c" and crc32c is None:
+            raise ValueError("method 'crc32c' requires the crc32c package")
         self.method = method
+        self._hashcls = _HASH_CLASSES.get(method, hashlib.md5)
 
-    def _hash(self, long_url):
-        """Generate hash for the long URL."""
+    def _hash(self, data):
+        """Generate an integer hash (at most 64 bits) for the encoded long URL."""
         if self.method == "crc32":
-            return format(zlib.crc32(long_url.encode()), "x")
-        elif self.method == "sha1":
-            return hashlib.sha1(long_url.encode()).hexdigest()
+            return zlib.crc32(data)
+        elif self.method == "crc32c":
+            return crc32c(data)
         else:
-            return hashlib.md5(long_url.encode()).hexdigest()
+            # 48 raw digest bits cover the ~41.7-bit 7-char base62 space
+            return int.from_bytes(self._hashcls(data).digest()[:6], "little")
 
     def get_shortened_url(self, long_url, db: InMemoryDB):
         """
@@ -64,18 +115,21 @@ class HashShortener(ShorteningStrategy):
         
         Process:
         1. Hash the long URL
-        2. Take first 7 characters
-        3. Check for collisions using Bloom filter
-        4. If collision, rehash and try again
+        2. Encode the hash as 7 base62 characters
+        3. Check for collisions using Bloom filter, confirming positives
+           with an exact membership test
+        4. If collision, probe hash + i * golden-ratio step (i = 1, 2, ...)
         5. Store and return short URL
         """
-        hashed = self._hash(long_url)
-        short = hashed[:7]
+        base = self._hash(long_url.encode())
+        short = _short_code(base)
 
-        # Ensure uniqueness
-        while db.exists(short):
-            short += "unique"
-            short = hashlib.md5(short.encode()).hexdigest()[:7]
+        # Ensure uniqueness with constant-time arithmetic probing; Bloom
+        # false positives never trigger a probe
+        i = 0
+        while db.exists(short) and short in db:
+            i += 1
+            short = _short_code((base + i * _GOLDEN64) & _MASK64)
 
         db.save(short, long_url)
         return short
@@ -88,18 +142,62 @@ class HashShortener(ShorteningStrategy):
         return db.get(shortened_url)
 
 
+class _WorkerLease:
+    """Thread-local marker whose collection returns a thread's generator."""
+
+    __slots__ = ("__weakref__",)
+
+
 class SnowflakeShortener(ShorteningStrategy):
     """
     Snowflake-based URL shortening strategy.
     
     Uses distributed ID generation with base62 encoding.
-    No collision handling needed (69+ year guarantee).
+    No collision handling needed (~139 year guarantee).
     Better for distributed systems.
+    
+    Each thread lazily gets its own Snowflake generator with a distinct
+    worker ID, so concurrent shortening never contends on one lock. The
+    generator is shared by every SnowflakeShortener used on that thread,
+    and goes back to a pool (keeping its state, so its IDs keep
+    increasing) when the thread exits.
     """
     
-    def __init__(self):
-        """Initialize Snowflake shortener."""
-        self.snowflake = Snowflake()
+    # Shared by all instances, so no two live generators share a worker ID
+    _worker_ids = itertools.count()
+    _released = []  # generators of finished threads, ready for reuse
+    _pool_lock = threading.Lock()
+    _local = threading.local()
+
+    @property
+    def snowflake(self):
+        """
+        The calling thread's Snowflake generator.
+        
+        Raises:
+            RuntimeError: If all MAX_WORKERS worker IDs are held by live threads
+        """
+        try:
+            return SnowflakeShortener._local.snowflake
+        except AttributeError:
+            return SnowflakeShortener._acquire()
+
+    @staticmethod
+    def _acquire():
+        """Give the calling thread a generator, reusing a released one if any."""
+        cls = SnowflakeShortener
+        with cls._pool_lock:
+            if cls._released:
+                snowflake = cls._released.pop()
+            else:
+                worker_id = next(cls._worker_ids)
+                if worker_id >= MAX_WORKERS:
+                    raise RuntimeError(f"all {MAX_WORKERS} Snowflake worker IDs are in use")
+                snowflake = Snowflake(worker_id)
+        lease = cls._local.lease = _WorkerLease()
+        weakref.finalize(lease, cls._released.append, snowflake)
+        cls._local.snowflake = snowflake
+        return snowflake
 
     def get_shortened_url(self, long_url, db: InMemoryDB):
         """
@@ -114,6 +212,23 @@ class SnowflakeShortener(ShorteningStrategy):
         short = base62_encode(num)
         db.save(short, long_url)
         return short
+
+    def get_shortened_urls(self, long_urls, db: InMemoryDB):
+        """
+        Shorten many URLs, reserving all their Snowflake IDs at once.
+        
+        Args:
+            long_urls: Iterable of URLs to shorten
+            db: Database instance for storing mappings
+            
+        Returns:
+            List of shortened URL strings, in input order
+        """
+        long_urls = list(long_urls)
+        shorts = base62_encode_batch(self.snowflake.generate_batch(len(long_urls)))
+        for short, long_url in zip(shorts, long_urls):
+            db.save(short, long_url)
+        return shorts
     
     def get_longer_url(self, shortened_url, db: InMemoryDB):
         """
@@ -1,9 +1,14 @@
+import threading
 import unittest
+from unittest import mock
+import url_shortener
 from url_shortener import URLShortener
-from strategies import HashShortener, SnowflakeShortener
-from database import InMemoryDB
+import strategies
+from strategies import HashShortener, ShorteningStrategy, SnowflakeShortener
+from database import BLOOM_BITS_PER_ENTRY, InMemoryDB, PackedDB, ShardedDB
 from bloom_filter import SimpleBloomFilter
-from encoding import base62_encode
+from fast_bloom import BlockedBloomFilter
+from encoding import base62_encode, base62_encode_batch
 from snowflake import Snowflake
 
 
@@ -32,7 +37,7 @@ class TestSimpleBloomFilter(unittest.TestCase):
     
     def test_hashes_returns_three_values(self):
         """Test that _hashes returns exactly three hash values."""
-        hashes = self.bloom._hashes("test")
+        hashes = list(self.bloom._hashes("test"))
         self.assertEqual(len(hashes), 3)
         self.assertTrue(all(isinstance(h, int) for h in hashes))
     
@@ -45,6 +50,54 @@ class TestSimpleBloomFilter(unittest.TestCase):
             self.assertLess(h, self.bloom.size)
 
 
+class TestBlockedBloomFilter(unittest.TestCase):
+    """Test cases for BlockedBloomFilter class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bloom = BlockedBloomFilter(size=1000)
+    
+    def test_add_and_contains(self):
+        """Test adding and checking if value exists in Bloom filter."""
+        value = "test_url"
+        self.assertFalse(self.bloom.contains(value))
+        self.bloom.add(value)
+        self.assertTrue(self.bloom.contains(value))
+    
+    def test_size_rounded_to_whole_blocks(self):
+        """Test that size is rounded up to whole 512-bit blocks."""
+        self.assertEqual(self.bloom.num_blocks, 2)
+        self.assertEqual(self.bloom.size, 1024)
+    
+    def test_locate_sets_one_bit_per_lane(self):
+        """Test that a value maps to one in-range block with 8 bits set."""
+        idx, mask = self.bloom._locate("test_url")
+        self.assertGreaterEqual(idx, 0)
+        self.assertLess(idx, self.bloom.num_blocks)
+        for lane in range(8):
+            lane_bits = (mask >> (lane * 64)) & ((1 << 64) - 1)
+            self.assertEqual(bin(lane_bits).count("1"), 1)
+
+
+def save_concurrently(db, threads=8, per_thread=3000):
+    """Save per_thread mappings from each of several threads; return any errors."""
+    errors = []
+    
+    def save(t):
+        try:
+            for i in range(per_thread):
+                db.save(f"t{t}-{i}", f"https://example.com/{t}/{i}")
+        except Exception as e:
+            errors.append(e)
+    
+    workers = [threading.Thread(target=save, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return errors
+
+
 class TestInMemoryDB(unittest.TestCase):
     """Test cases for InMemoryDB class."""
     
@@ -84,6 +137,170 @@ class TestInMemoryDB(unittest.TestCase):
         
         for short, long in urls:
             self.assertEqual(self.db.get(short), long)
+    
+    def test_contains(self):
+        """Test exact membership."""
+        self.db.save("abc123", "https://example.com")
+        self.assertIn("abc123", self.db)
+        self.assertNotIn("missing", self.db)
+    
+    def test_bloom_grows_with_saves(self):
+        """Test that a default database keeps accepting hash codes past 10k saves."""
+        strategy = HashShortener()
+        for i in range(12_000):
+            strategy.get_shortened_url(f"https://example.com/{i}", self.db)
+        self.assertEqual(len(self.db.map), 12_000)
+        self.assertGreaterEqual(self.db.bloom.size, 12_000 * BLOOM_BITS_PER_ENTRY)
+    
+    def test_concurrent_saves_while_bloom_grows(self):
+        """Test that saves from several threads survive Bloom filter rebuilds."""
+        self.assertEqual(save_concurrently(self.db), [])
+        self.assertEqual(len(self.db.map), 8 * 3000)
+        for t in range(8):
+            for i in range(3000):
+                self.assertTrue(self.db.exists(f"t{t}-{i}"))
+    
+    def test_get_skips_bloom_filter(self):
+        """Test that reads never consult the Bloom filter."""
+        self.db.save("abc123", "https://example.com")
+        self.db.bloom = None
+        self.assertEqual(self.db.get("abc123"), "https://example.com")
+        self.assertIsNone(self.db.get("missing"))
+    
+    def test_reserve_grows_bloom_and_keeps_keys(self):
+        """Test that reserve grows the Bloom filter without losing keys."""
+        self.db.save("abc123", "https://example.com")
+        self.db.reserve(100000)
+        self.assertGreaterEqual(self.db.bloom.size, 100000 * 16)
+        self.assertTrue(self.db.exists("abc123"))
+        self.assertEqual(self.db.get("abc123"), "https://example.com")
+    
+    def test_expected_size_sizes_bloom(self):
+        """Test that expected_size scales the Bloom filter."""
+        db = InMemoryDB(expected_size=100000)
+        self.assertGreaterEqual(db.bloom.size, 100000 * 16)
+
+
+class TestPackedDB(unittest.TestCase):
+    """Test cases for PackedDB class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.db = PackedDB()
+    
+    def test_save_and_get(self):
+        """Test saving and retrieving several mappings, including non-ASCII."""
+        urls = [
+            ("short1", "https://example1.com"),
+            ("short2", "https://例え.jp/パス"),
+            ("short3", ""),
+        ]
+        
+        for short, long in urls:
+            self.db.save(short, long)
+        
+        for short, long in urls:
+            self.assertEqual(self.db.get(short), long)
+            self.assertTrue(self.db.exists(short))
+            self.assertIn(short, self.db)
+        self.assertNotIn("missing", self.db)
+    
+    def test_get_nonexistent_url(self):
+        """Test getting a URL that doesn't exist."""
+        self.assertIsNone(self.db.get("nonexistent"))
+    
+    def test_overwrite(self):
+        """Test that saving a short URL again replaces its long URL."""
+        self.db.save("abc", "https://old.example.com")
+        self.db.save("abc", "https://new.example.com")
+        self.assertEqual(self.db.get("abc"), "https://new.example.com")
+    
+    def test_index_growth(self):
+        """Test that all mappings survive the index being resized."""
+        for i in range(1000):
+            self.db.save(f"s{i}", f"https://example.com/{i}")
+        
+        self.assertEqual(self.db.count, 1000)
+        for i in range(1000):
+            self.assertEqual(self.db.get(f"s{i}"), f"https://example.com/{i}")
+    
+    def test_reserve_presizes_index(self):
+        """Test that reserve sizes the index and keeps existing mappings."""
+        self.db.save("abc", "https://example.com")
+        self.db.reserve(1000)
+        self.assertGreaterEqual(len(self.db.table), 2000)
+        self.assertTrue(self.db.exists("abc"))
+        self.assertEqual(self.db.get("abc"), "https://example.com")
+    
+    def test_long_short_url(self):
+        """Test a short URL longer than 255 bytes."""
+        short = "s" * 300
+        self.db.save(short, "https://example.com/long-key")
+        self.db.save("abc", "https://example.com")
+        self.assertEqual(self.db.get(short), "https://example.com/long-key")
+        self.assertEqual(self.db.get("abc"), "https://example.com")
+    
+    def test_failed_save_leaves_store_intact(self):
+        """Test that a URL that cannot be encoded is rejected without side effects."""
+        self.db.save("abc", "https://example.com")
+        with self.assertRaises(UnicodeEncodeError):
+            self.db.save("bad", "https://example.com/\ud800")
+        self.assertEqual(self.db.count, 1)
+        self.assertNotIn("bad", self.db)
+        self.assertEqual(self.db.get("abc"), "https://example.com")
+    
+    def test_concurrent_saves(self):
+        """Test that saves from several threads all land in the index."""
+        self.assertEqual(save_concurrently(self.db), [])
+        self.assertEqual(self.db.count, 8 * 3000)
+        for t in range(8):
+            for i in range(3000):
+                self.assertEqual(self.db.get(f"t{t}-{i}"), f"https://example.com/{t}/{i}")
+    
+    def test_works_with_shortener(self):
+        """Test PackedDB as a drop-in store for a strategy."""
+        shortener = HashShortener()
+        short = shortener.get_shortened_url("https://example.com/test", self.db)
+        self.assertEqual(shortener.get_longer_url(short, self.db), "https://example.com/test")
+
+
+class TestShardedDB(unittest.TestCase):
+    """Test cases for ShardedDB class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.db = ShardedDB(num_shards=3)
+    
+    def test_shard_count_rounded_to_power_of_two(self):
+        """Test that the shard count is rounded up to a power of two."""
+        self.assertEqual(len(self.db.shards), 4)
+        self.assertEqual(self.db.mask, 3)
+    
+    def test_reserve(self):
+        """Test that reserve is spread across the shards."""
+        self.db.reserve(4000)
+        for shard in self.db.shards:
+            self.assertGreaterEqual(shard.bloom.size, 1000 * 16)
+    
+    def test_save_get_exists(self):
+        """Test that mappings round-trip across shards."""
+        for i in range(100):
+            self.db.save(f"s{i}", f"https://example.com/{i}")
+        
+        for i in range(100):
+            self.assertIn(f"s{i}", self.db)
+            self.assertTrue(self.db.exists(f"s{i}"))
+            self.assertEqual(self.db.get(f"s{i}"), f"https://example.com/{i}")
+        self.assertIsNone(self.db.get("missing"))
+        self.assertTrue(all(shard.map for shard in self.db.shards))
+    
+    def test_concurrent_saves_while_bloom_grows(self):
+        """Test that saves from several threads survive shard Bloom rebuilds."""
+        self.assertEqual(save_concurrently(self.db), [])
+        for t in range(8):
+            for i in range(3000):
+                self.assertTrue(self.db.exists(f"t{t}-{i}"))
+                self.assertEqual(self.db.get(f"t{t}-{i}"), f"https://example.com/{t}/{i}")
 
 
 class TestBase62Encoding(unittest.TestCase):
@@ -111,6 +328,11 @@ class TestBase62Encoding(unittest.TestCase):
         """Test that encode returns a string."""
         result = base62_encode(12345)
         self.assertIsInstance(result, str)
+    
+    def test_encode_batch_matches_single(self):
+        """Test that batch encoding agrees with single encoding."""
+        nums = [0, 1, 61, 62, 3843, 3844, 1000000, 2 ** 63]
+        self.assertEqual(base62_encode_batch(nums), [base62_encode(n) for n in nums])
 
 
 class TestSnowflake(unittest.TestCase):
@@ -143,6 +365,45 @@ class TestSnowflake(unittest.TestCase):
         # Most should be increasing (allowing for same timestamp scenarios)
         increasing_count = sum(1 for i in range(len(ids) - 1) if ids[i] < ids[i + 1])
         self.assertGreaterEqual(increasing_count, len(ids) - 2)
+    
+    def test_sequence_overflow_stays_unique(self):
+        """Test that more than 4096 IDs in one millisecond stay unique."""
+        self.snowflake._timestamp = lambda: 1000
+        ids = [self.snowflake.generate() for _ in range(5000)]
+        self.assertEqual(ids, sorted(set(ids)))
+    
+    def test_clock_moving_backwards(self):
+        """Test that IDs keep increasing when the clock steps backwards."""
+        self.snowflake._timestamp = lambda: 2000
+        id1 = self.snowflake.generate()
+        self.snowflake._timestamp = lambda: 1000
+        id2 = self.snowflake.generate()
+        self.assertGreater(id2, id1)
+    
+    def test_generate_batch(self):
+        """Test that a batch is increasing and continues the sequence."""
+        self.snowflake._timestamp = lambda: 1000
+        first = self.snowflake.generate()
+        batch = self.snowflake.generate_batch(5000)
+        self.assertEqual(batch, sorted(set(batch)))
+        self.assertEqual(len(batch), 5000)
+        self.assertGreater(batch[0], first)
+        self.assertGreater(self.snowflake.generate(), batch[-1])
+    
+    def test_worker_ids_do_not_collide(self):
+        """Test that generators with different worker IDs never collide."""
+        a, b = Snowflake(worker_id=1), Snowflake(worker_id=2)
+        a._timestamp = b._timestamp = lambda: 1000
+        ids_a = a.generate_batch(3000)
+        ids_b = b.generate_batch(3000)
+        self.assertFalse(set(ids_a) & set(ids_b))
+    
+    def test_worker_id_out_of_range(self):
+        """Test that worker IDs outside the worker bits are rejected."""
+        with self.assertRaises(ValueError):
+            Snowflake(worker_id=4096)
+        with self.assertRaises(ValueError):
+            Snowflake(worker_id=-1)
 
 
 class TestHashShortener(unittest.TestCase):
@@ -199,6 +460,18 @@ class TestHashShortener(unittest.TestCase):
             self.assertIsNotNone(short)
             self.assertEqual(len(short), 7)
     
+    @unittest.skipUnless(strategies.crc32c, "crc32c package not installed")
+    def test_crc32c_method(self):
+        """Test the hardware CRC32C method when the package is available."""
+        short = HashShortener(method="crc32c").get_shortened_url("https://example.com/test", self.db)
+        self.assertEqual(len(short), 7)
+    
+    @unittest.skipIf(strategies.crc32c, "crc32c package installed")
+    def test_crc32c_method_unavailable(self):
+        """Test that crc32c is rejected up front when the package is missing."""
+        with self.assertRaises(ValueError):
+            HashShortener(method="crc32c")
+    
     def test_collision_resolution(self):
         """Test that collision resolution works."""
         # This is hard to test directly, but we verify no exception is raised
@@ -207,6 +480,23 @@ class TestHashShortener(unittest.TestCase):
             url = f"https://example.com/url{i}"
             short = self.shortener.get_shortened_url(url, self.db)
             self.assertIsNotNone(short)
+    
+    def test_collision_probing(self):
+        """Test that a taken code is resolved by probing to a new code."""
+        long_url = "https://example.com/test"
+        short1 = self.shortener.get_shortened_url(long_url, self.db)
+        short2 = self.shortener.get_shortened_url(long_url, self.db)
+        
+        self.assertNotEqual(short1, short2)
+        self.assertEqual(len(short2), 7)
+        self.assertEqual(self.db.get(short2), long_url)
+    
+    def test_bloom_false_positive_does_not_probe(self):
+        """Test that a Bloom positive without a stored mapping keeps the first code."""
+        long_url = "https://example.com/test"
+        short = self.shortener.get_shortened_url(long_url, InMemoryDB())
+        self.db.bloom.add(short)
+        self.assertEqual(self.shortener.get_shortened_url(long_url, self.db), short)
 
 
 class TestSnowflakeShortener(unittest.TestCase):
@@ -255,6 +545,52 @@ class TestSnowflakeShortener(unittest.TestCase):
             shorts.add(short)
         
         self.assertEqual(len(shorts), 10)
+    
+    def test_threads_get_own_generators(self):
+        """Test that each thread uses its own Snowflake worker."""
+        main_worker = self.shortener.snowflake.worker_id
+        workers = []
+        thread = threading.Thread(target=lambda: workers.append(self.shortener.snowflake.worker_id))
+        thread.start()
+        thread.join()
+        self.assertNotEqual(workers[0], main_worker)
+    
+    def test_instances_share_thread_generator(self):
+        """Test that shorteners on one thread never issue the same ID."""
+        first = SnowflakeShortener()
+        for _ in range(5000):
+            last = SnowflakeShortener()
+        self.assertIs(first.snowflake, last.snowflake)
+        short_a = first.get_shortened_url("https://example.com/a", self.db)
+        short_b = last.get_shortened_url("https://example.com/b", self.db)
+        self.assertNotEqual(short_a, short_b)
+        self.assertEqual(self.db.get(short_a), "https://example.com/a")
+    
+    def test_worker_ids_exhausted(self):
+        """Test that a thread raises rather than reuse a live worker ID."""
+        errors = []
+        
+        def shorten():
+            try:
+                self.shortener.get_shortened_url("https://example.com/test", self.db)
+            except RuntimeError as e:
+                errors.append(e)
+        
+        with mock.patch.object(SnowflakeShortener, "_worker_ids", iter([4096])), \
+                mock.patch.object(SnowflakeShortener, "_released", []):
+            thread = threading.Thread(target=shorten)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(errors), 1)
+    
+    def test_get_shortened_urls_batch(self):
+        """Test shortening a batch of URLs in one call."""
+        urls = [f"https://example.com/url{i}" for i in range(10)]
+        shorts = self.shortener.get_shortened_urls(urls, self.db)
+        
+        self.assertEqual(len(set(shorts)), 10)
+        for short, url in zip(shorts, urls):
+            self.assertEqual(self.shortener.get_longer_url(short, self.db), url)
 
 
 class TestURLShortener(unittest.TestCase):
@@ -297,6 +633,7 @@ class TestURLShortener(unittest.TestCase):
         short2 = self.shortener.shorten(long_url)
         resolved2 = self.shortener.resolve(short2)
         self.assertEqual(resolved2, long_url)
+        self.assertNotEqual(short2, short1)
     
     def test_multiple_urls_same_db(self):
         """Test shortening multiple URLs with the same database."""
@@ -315,8 +652,121 @@ class TestURLShortener(unittest.TestCase):
         for short, url in zip(shorts, urls):
             self.assertEqual(self.shortener.resolve(short), url)
     
+    def test_shorten_uses_shorten_and_store(self):
+        """Test that a strategy's fused shorten_and_store is what gets called."""
+        class FusedShortener(HashShortener):
+            def shorten_and_store(self, long_url, db):
+                db.save("fused", long_url)
+                return "fused"
+        
+        shortener = URLShortener(FusedShortener(), db=InMemoryDB())
+        self.assertEqual(shortener.shorten("https://example.com/fused"), "fused")
+        self.assertEqual(shortener.resolve("fused"), "https://example.com/fused")
+        
+        batch = URLShortener(FusedShortener(), db=InMemoryDB())
+        self.assertEqual(batch.shorten_many(["https://example.com/fused"]), ["fused"])
+    
+    def test_get_shortened_url_override_used(self):
+        """Test that a subclass overriding only get_shortened_url is honored."""
+        class CustomShortener(HashShortener):
+            def get_shortened_url(self, long_url, db):
+                db.save("custom", long_url)
+                return "custom"
+        
+        shortener = URLShortener(CustomShortener(), db=InMemoryDB())
+        self.assertEqual(shortener.shorten("https://example.com/custom"), "custom")
+        frozen = URLShortener.frozen(CustomShortener())
+        self.assertEqual(frozen.shorten("https://example.com/c"), "custom")
+    
+    def test_shorten_and_store_default(self):
+        """Test that the default shorten_and_store delegates to get_shortened_url."""
+        class CounterShortener(ShorteningStrategy):
+            def get_shortened_url(self, long_url, db):
+                db.save("c1", long_url)
+                return "c1"
+            
+            def get_longer_url(self, shortened_url, db):
+                return db.get(shortened_url)
+        
+        shortener = URLShortener(CounterShortener(), db=InMemoryDB())
+        self.assertEqual(shortener.shorten("https://example.com/c"), "c1")
+    
+    def test_strategy_assignment_rejected(self):
+        """Test that the strategy can only change through set_strategy."""
+        with self.assertRaises(AttributeError):
+            self.shortener.strategy = SnowflakeShortener()
+        self.assertIsInstance(self.shortener.strategy, HashShortener)
+    
+    def test_repeat_url_returns_same_short(self):
+        """Test that shortening the same URL twice reuses the short URL."""
+        self.shortener.set_strategy(SnowflakeShortener())
+        url = "https://example.com/test"
+        self.assertEqual(self.shortener.shorten(url), self.shortener.shorten(url))
+    
+    def test_dedupe_disabled(self):
+        """Test that dedupe=False skips the long → short index."""
+        shortener = URLShortener(SnowflakeShortener(), db_impl=PackedDB, dedupe=False)
+        url = "https://example.com/test"
+        first, second = shortener.shorten(url), shortener.shorten(url)
+        self.assertNotEqual(first, second)
+        self.assertEqual(shortener.resolve(first), url)
+        self.assertEqual(shortener.resolve(second), url)
+        self.assertEqual(len(shortener.shorten_many([url, url])), 2)
+        self.assertIsNone(shortener._reverse)
+        shortener.set_strategy(HashShortener())
+        self.assertEqual(shortener.resolve(shortener.shorten(url)), url)
+    
+    def test_shorten_many_and_resolve_many(self):
+        """Test batch shortening and resolving, including repeats."""
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/a"]
+        
+        for strategy in (HashShortener(), SnowflakeShortener()):
+            shortener = URLShortener(strategy, db=InMemoryDB())
+            shorts = shortener.shorten_many(urls)
+            
+            self.assertEqual(shorts[0], shorts[2])
+            self.assertNotEqual(shorts[0], shorts[1])
+            self.assertEqual(shortener.shorten(urls[1]), shorts[1])
+            self.assertEqual(shortener.resolve_many(shorts + ["missing"]), urls + [None])
+    
+    def test_expected_capacity(self):
+        """Test that expected_capacity reserves room in the database."""
+        shortener = URLShortener(HashShortener(), db=InMemoryDB(), expected_capacity=50000)
+        self.assertGreaterEqual(shortener.db.bloom.size, 50000 * 16)
+    
+    def test_db_impl(self):
+        """Test selecting the storage backend by class."""
+        shortener = URLShortener(HashShortener(), db_impl=PackedDB)
+        self.assertIsInstance(shortener.db, PackedDB)
+        short = shortener.shorten("https://example.com/packed")
+        self.assertEqual(shortener.resolve(short), "https://example.com/packed")
+    
+    def test_frozen(self):
+        """Test a shortener frozen to one strategy."""
+        shortener = URLShortener.frozen(HashShortener(), db=InMemoryDB())
+        self.assertIsInstance(shortener, URLShortener)
+        
+        url = "https://example.com/frozen"
+        short = shortener.shorten(url)
+        self.assertEqual(shortener.shorten(url), short)
+        self.assertEqual(shortener.resolve(short), url)
+        self.assertIsNone(shortener.resolve("missing"))
+        with self.assertRaises(TypeError):
+            shortener.set_strategy(SnowflakeShortener())
+    
+    def test_frozen_class_reused(self):
+        """Test that frozen shorteners share one subclass and accept expected_capacity."""
+        a = URLShortener.frozen(HashShortener())
+        b = URLShortener.frozen(SnowflakeShortener(), db_impl=PackedDB, expected_capacity=1000)
+        self.assertIs(type(a), type(b))
+        self.assertGreaterEqual(len(b.db.table), 2000)
+    
+    def test_no_instance_dict(self):
+        """Test that URLShortener instances use slots, not a __dict__."""
+        self.assertFalse(hasattr(self.shortener, "__dict__"))
+    
     def test_strategy_isolation(self):
-        """Test that different strategies have separate databases."""
+        """Test that default shorteners keep separate databases."""
         shortener1 = URLShortener(HashShortener())
         shortener2 = URLShortener(SnowflakeShortener())
         
@@ -324,8 +774,55 @@ class TestURLShortener(unittest.TestCase):
         short1 = shortener1.shorten(url)
         short2 = shortener2.shorten(url)
         
-        # Different databases, so shorts should be different
+        # Different strategies, so shorts should be different
         self.assertNotEqual(short1, short2)
+        self.assertIsNone(shortener2.resolve(short1))
+    
+    def test_default_db_not_shared(self):
+        """Test that default hash shorteners give a URL the same code."""
+        url = "https://example.com/test"
+        self.assertEqual(URLShortener(HashShortener()).shorten(url), URLShortener(HashShortener()).shorten(url))
+    
+    def test_instances_share_explicit_db(self):
+        """Test that short URLs resolve through any instance given the same db."""
+        db = InMemoryDB()
+        short = URLShortener(HashShortener(), db=db).shorten("https://example.com/shared")
+        other = URLShortener(SnowflakeShortener(), db=db)
+        self.assertEqual(other.resolve(short), "https://example.com/shared")
+    
+    def test_injected_db(self):
+        """Test that an injected database keeps mappings private."""
+        db = InMemoryDB()
+        short = URLShortener(HashShortener(), db=db).shorten("https://example.com/private")
+        self.assertEqual(db.get(short), "https://example.com/private")
+        self.assertIsNone(URLShortener(HashShortener()).resolve(short))
+
+
+class TestResolveDelegation(unittest.TestCase):
+    """Test that resolve always asks the strategy."""
+    
+    def test_strategy_with_own_storage(self):
+        """Test that a short URL absent from the database is still resolved by the strategy."""
+        strategy = HashShortener()
+        strategy.get_longer_url = lambda short_url, db: "https://example.com/elsewhere"
+        shortener = URLShortener(strategy, db=InMemoryDB())
+        self.assertEqual(shortener.resolve("abc1234"), "https://example.com/elsewhere")
+    
+    def test_miss_returns_none(self):
+        """Test that an unknown short URL resolves to None."""
+        shortener = URLShortener(HashShortener(), db=InMemoryDB())
+        self.assertIsNone(shortener.resolve("missing"))
+
+
+class TestModuleLevelAPI(unittest.TestCase):
+    """Test cases for the module-level shorten/resolve functions."""
+    
+    def test_shorten_and_resolve(self):
+        """Test the default shortener's pre-bound functions."""
+        url = "https://example.com/module-level"
+        short = url_shortener.shorten(url)
+        self.assertEqual(url_shortener.shorten(url), short)
+        self.assertEqual(url_shortener.resolve(short), url)
 
 
 class TestIntegration(unittest.TestCase):
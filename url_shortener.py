@@ -1,43 +1,152 @@
+import functools
+
 from database import InMemoryDB
-from strategies import ShorteningStrategy
+from strategies import HashShortener, ShorteningStrategy
 
 
 class URLShortener:
     """
     Context class implementing the Strategy pattern.
     Provides a unified interface for URL shortening with pluggable strategies.
+    
+    Each instance owns a private store unless a database is passed in;
+    pass the same db to several shorteners to have them share mappings.
+    Swapping strategies with set_strategy() never drops existing mappings.
     """
     
-    def __init__(self, strategy: ShorteningStrategy):
+    __slots__ = ("strategy", "db", "_shorten_fn", "_resolve_fn", "_reverse")
+    
+    def __init__(self, strategy: ShorteningStrategy, db=None, db_impl=None, expected_capacity=None,
+                 dedupe=True):
         """
         Initialize URL shortener with a strategy.
         
         Args:
             strategy: ShorteningStrategy implementation to use
+            db: Database to store mappings in, possibly shared with other
+                shorteners; defaults to a new private store
+            db_impl: Database class (e.g. PackedDB) to build the private
+                store from when no db is given; defaults to InMemoryDB
+            expected_capacity: Approximate number of mappings to reserve
+                room for in the database up front
+            dedupe: Keep a long → short index so repeat submissions get
+                their existing short URL back; it holds every long URL in
+                memory, so pass False to keep a compact store compact
+        """
+        if db is None:
+            db = (db_impl or InMemoryDB)()
+        self.db = db
+        if expected_capacity is not None:
+            self.db.reserve(expected_capacity)
+        # long → short, so repeat submissions skip the strategy (None: no dedup)
+        self._reverse = {} if dedupe else None
+        object.__setattr__(self, "strategy", strategy)
+        self._configure()
+
+    def __setattr__(self, name, value):
+        # The hot paths use state derived from the strategy in _configure(),
+        # so a bare assignment would leave them calling the old strategy.
+        if name == "strategy":
+            raise AttributeError("use set_strategy() to switch strategies")
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def frozen(cls, strategy: ShorteningStrategy, db=None, db_impl=None, expected_capacity=None,
+               dedupe=True):
+        """
+        Build a shortener permanently bound to one strategy.
+        
+        The instance belongs to a subclass, created once per class, whose
+        set_strategy() raises TypeError; its hot paths keep calling the
+        strategy methods bound in _configure().
+        
+        Args:
+            strategy: ShorteningStrategy implementation to use
+            db: Database to store mappings in; defaults to a new private store
+            db_impl: Database class to build the private store from
+            expected_capacity: Approximate number of mappings to reserve
+                room for in the database up front
+            dedupe: Keep the long → short index (see __init__)
+            
+        Returns:
+            URLShortener instance that cannot switch strategies
         """
-        self.strategy = strategy
-        self.db = InMemoryDB()
+        return _frozen_class(cls)(strategy, db, db_impl, expected_capacity, dedupe)
 
     def set_strategy(self, strategy: ShorteningStrategy):
         """
         Switch to a different shortening strategy at runtime.
         
+        This is the only way to change the strategy: it rebinds the hot
+        paths and empties the long → short index, so it is comparatively
+        costly and meant to be rare.
+        
         Args:
             strategy: New ShorteningStrategy implementation to use
         """
-        self.strategy = strategy
+        object.__setattr__(self, "strategy", strategy)
+        self._configure()
+
+    def _configure(self):
+        """
+        Derive everything the hot paths need from the current strategy.
+        
+        Runs once per strategy (from __init__ and set_strategy) so that
+        shorten() and resolve() never look anything up on the strategy.
+        """
+        strategy = self.strategy
+        if type(strategy).shorten_and_store is ShorteningStrategy.shorten_and_store:
+            self._shorten_fn = strategy.get_shortened_url  # skip the delegating frame
+        else:
+            self._shorten_fn = strategy.shorten_and_store
+        self._resolve_fn = strategy.get_longer_url
+        if self._reverse is not None:
+            self._reverse.clear()  # entries were issued by the previous strategy
 
     def shorten(self, long_url):
         """
         Shorten a long URL using the current strategy.
         
+        A URL that was already shortened by this instance since the last
+        strategy switch gets its existing short URL back, unless the
+        instance was built with dedupe=False.
+        
         Args:
             long_url: The URL to shorten
             
         Returns:
             Shortened URL string
         """
-        return self.strategy.get_shortened_url(long_url, self.db)
+        reverse = self._reverse
+        if reverse is None:
+            return self._shorten_fn(long_url, self.db)
+        short_url = reverse.get(long_url)
+        if short_url is None:
+            short_url = reverse[long_url] = self._shorten_fn(long_url, self.db)
+        return short_url
+
+    def shorten_many(self, long_urls):
+        """
+        Shorten many long URLs in one call.
+        
+        URLs not yet seen by this instance are shortened together through
+        the strategy's get_shortened_urls(), once each even if repeated
+        (with dedupe=False every input is passed through as is).
+        
+        Args:
+            long_urls: Iterable of URLs to shorten
+            
+        Returns:
+            List of shortened URL strings, in input order
+        """
+        long_urls = list(long_urls)
+        reverse = self._reverse
+        if reverse is None:
+            return self.strategy.get_shortened_urls(long_urls, self.db)
+        pending = [long_url for long_url in dict.fromkeys(long_urls) if long_url not in reverse]
+        if pending:
+            reverse.update(zip(pending, self.strategy.get_shortened_urls(pending, self.db)))
+        return [reverse[long_url] for long_url in long_urls]
 
     def resolve(self, short_url):
         """
@@ -49,4 +158,36 @@ class URLShortener:
         Returns:
             Original long URL or None if not found
         """
-        return self.strategy.get_longer_url(short_url, self.db)
+        return self._resolve_fn(short_url, self.db)
+
+    def resolve_many(self, short_urls):
+        """
+        Resolve many short URLs in one call.
+        
+        Args:
+            short_urls: Iterable of shortened URLs
+            
+        Returns:
+            List of original long URLs (None where not found), in input order
+        """
+        resolve = self.resolve
+        return [resolve(short_url) for short_url in short_urls]
+
+
+@functools.lru_cache(maxsize=None)
+def _frozen_class(base):
+    """Build (once per base class) the subclass returned by base.frozen()."""
+    def set_strategy(self, strategy):
+        raise TypeError("frozen URLShortener cannot switch strategies")
+
+    return type("Frozen" + base.__name__, (base,), {
+        "__slots__": (),
+        "set_strategy": set_strategy,
+    })
+
+
+# Process-wide default shortener; the module-level functions are its
+# pre-bound methods, so callers skip the attribute lookup on each call.
+_default = URLShortener(HashShortener())
+shorten = _default.shorten
+resolve = _default.resolve